@@ -0,0 +1,105 @@
+"""
+Shared helpers for the pyproject.toml dependency scripts.
+"""
+
+import re
+import sys
+from collections import namedtuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Package name followed by a version specifier, e.g. "requests>=2.31.0"
+_DEP_RE = re.compile(r"^([a-zA-Z0-9_.-]+)(==|>=|<=|>|<|!=|~=)(.+)$")
+
+# Characters allowed in a package name and the version operators that may follow it
+_NAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.-"
+_TWO_CHAR_OPERATORS = frozenset({"==", ">=", "<=", "!=", "~="})
+_ONE_CHAR_OPERATORS = frozenset({">", "<"})
+
+# Normalize package names so that "Foo_Bar.baz" and "foo-bar-baz" compare equal
+_NAME_NORMALIZATION = str.maketrans({"_": "-", ".": "-"})
+
+# Development-related optional-dependency profiles that are never scanned
+DEV_PROFILE_NAMES = frozenset(
+    {
+        "dev",
+        "development",
+        "develop",
+        "test",
+        "testing",
+        "tests",
+        "lint",
+        "linting",
+        "format",
+        "formatting",
+        "docs",
+        "documentation",
+        "build",
+        "ci",
+        "cd",
+        "debug",
+        "local",
+    }
+)
+
+# A single parsed dependency entry; "original" is the string as written in pyproject.toml
+ParsedDep = namedtuple("ParsedDep", "package operator version marker original")
+
+
+def _split_specifier(dep_part):
+    """Split "name<op>version" without a regex; return None if it does not fit.
+
+    A bare package name is returned as (name, None, None).
+    """
+    rest = dep_part.lstrip(_NAME_CHARS)
+    if not rest:
+        return dep_part, None, None
+    pkg_name = dep_part[: len(dep_part) - len(rest)]
+    if not pkg_name:
+        return None
+
+    operator = rest[:2]
+    if operator not in _TWO_CHAR_OPERATORS:
+        operator = rest[:1]
+        if operator not in _ONE_CHAR_OPERATORS:
+            return None
+
+    pkg_version = rest[len(operator) :]
+    if not pkg_version:
+        return None
+    return pkg_name, operator, pkg_version
+
+
+def parse_dependency(dep_string):
+    """Parse a dependency string to extract package name, operator, and version."""
+    # Handle platform/environment markers
+    dep_part, sep, marker = dep_string.partition(";")
+    dep_part = dep_part.strip()
+    marker = marker.strip() if sep else None
+
+    # Split package name from version specifier, deferring to the regex for
+    # anything the fast scanner does not recognise
+    parts = _split_specifier(dep_part)
+    if parts is None:
+        match = _DEP_RE.match(dep_part)
+        # No version specified
+        parts = match.groups() if match else (dep_part, None, None)
+
+    # Package names are used as dict keys across every profile; intern them so
+    # repeated lookups can short-circuit on identity
+    pkg_name, operator, pkg_version = parts
+    return (
+        sys.intern(pkg_name.lower().translate(_NAME_NORMALIZATION)),
+        operator,
+        pkg_version.strip() if pkg_version else None,
+        marker,
+    )
+
+
+def load_pyproject(pyproject_file):
+    """Read and parse a pyproject.toml file."""
+    with open(pyproject_file, "rb") as f:
+        return tomllib.loads(f.read().decode("utf-8"))
@@ -4,68 +4,30 @@ Generate separate requirements.txt files for each profile in pyproject.toml.
 This prevents dependency conflicts during WhiteSource scanning.
 """
 
-import re
+import functools
 import sys
+import traceback
 import os
 from collections import defaultdict
 from packaging import version
-import toml
-
-
-def parse_dependency(dep_string):
-    """Parse a dependency string to extract package name, operator, and version."""
-    # Handle platform/environment markers
-    if ";" in dep_string:
-        dep_part = dep_string.split(";")[0].strip()
-        marker = dep_string.split(";")[1].strip()
-    else:
-        dep_part = dep_string.strip()
-        marker = None
-
-    # Match package name with version specifier
-    match = re.match(r"^([a-zA-Z0-9_.-]+)(==|>=|<=|>|<|!=|~=)(.+)$", dep_part)
-    if match:
-        pkg_name, operator, pkg_version = match.groups()
-        return (
-            pkg_name.lower().replace("_", "-").replace(".", "-"),
-            operator,
-            pkg_version.strip(),
-            marker,
-        )
-    else:
-        # No version specified
-        pkg_name = dep_part.lower().replace("_", "-").replace(".", "-")
-        return pkg_name, None, None, marker
+
+from _pyproject_common import (
+    DEV_PROFILE_NAMES,
+    ParsedDep,
+    load_pyproject,
+    parse_dependency,
+)
+
+# The same pinned versions tend to recur across profiles; parse each one only once
+_parse_version = functools.lru_cache(maxsize=None)(version.parse)
 
 
 def extract_dependencies_by_profile(pyproject_file):
     """Extract dependencies organized by profile."""
-    with open(pyproject_file, "r", encoding="utf-8") as f:
-        data = toml.load(f)
+    data = load_pyproject(pyproject_file)
 
     profiles = {}
 
-    # Define development-related profile names to skip
-    dev_profile_names = {
-        "dev",
-        "development",
-        "develop",
-        "test",
-        "testing",
-        "tests",
-        "lint",
-        "linting",
-        "format",
-        "formatting",
-        "docs",
-        "documentation",
-        "build",
-        "ci",
-        "cd",
-        "debug",
-        "local",
-    }
-
     # Main dependencies - always include these
     main_deps = []
     if "project" in data and "dependencies" in data["project"]:
@@ -78,7 +40,7 @@ def extract_dependencies_by_profile(pyproject_file):
     if "project" in data and "optional-dependencies" in data["project"]:
         for profile_name, deps in data["project"]["optional-dependencies"].items():
             # Skip development-related profiles
-            if profile_name.lower() not in dev_profile_names:
+            if profile_name.lower() not in DEV_PROFILE_NAMES:
                 # Each profile gets main dependencies + its specific dependencies
                 profiles[profile_name] = main_deps + deps
             else:
@@ -87,29 +49,41 @@ def extract_dependencies_by_profile(pyproject_file):
     return profiles
 
 
+def _consolidate_without_duplicates(deps):
+    """Map package names to requirements, or return None if any package repeats."""
+    consolidated = {}
+    for dep in deps:
+        pkg_name = parse_dependency(dep)[0]
+        if pkg_name in consolidated:
+            return None
+        consolidated[pkg_name] = dep
+    return consolidated
+
+
 def consolidate_profile_requirements(deps):
-    """Consolidate requirements for a single profile, removing duplicates."""
+    """Consolidate requirements for a single profile, removing duplicates.
+
+    Returns a dict of package name to requirement string, sorted by package name.
+    """
+    # Fast path: most profiles list each package once, so there is nothing to
+    # consolidate. Unparseable entries are reported by the full pass below.
+    try:
+        consolidated = _consolidate_without_duplicates(deps)
+    except Exception:
+        consolidated = None
+    if consolidated is not None:
+        return dict(sorted(consolidated.items()))
+
     # Parse all dependencies
-    parsed_deps = {}
-    original_deps = {}
+    parsed_deps = defaultdict(list)
 
     for dep in deps:
         try:
             pkg_name, operator, pkg_version, marker = parse_dependency(dep)
 
-            if pkg_name not in parsed_deps:
-                parsed_deps[pkg_name] = []
-                original_deps[pkg_name] = []
-
             parsed_deps[pkg_name].append(
-                {
-                    "operator": operator,
-                    "version": pkg_version,
-                    "marker": marker,
-                    "original": dep,
-                }
+                ParsedDep(pkg_name, operator, pkg_version, marker, dep)
             )
-            original_deps[pkg_name].append(dep)
         except Exception as e:
             print(f"⚠️  Could not parse dependency '{dep}': {e}")
 
@@ -118,28 +92,42 @@ def consolidate_profile_requirements(deps):
     for pkg_name, versions in parsed_deps.items():
         if len(versions) == 1:
             # Only one version, use it as-is
-            consolidated[pkg_name] = versions[0]["original"]
+            consolidated[pkg_name] = versions[0].original
         else:
             # Multiple versions, find the highest exact version
-            exact_versions = []
+            highest_version = None
+            highest_original = None
             for v in versions:
-                if v["operator"] == "==" and v["version"]:
+                if v.operator == "==" and v.version:
                     try:
-                        exact_versions.append(
-                            (version.parse(v["version"]), v["original"])
-                        )
+                        parsed_version = _parse_version(v.version)
                     except Exception:
                         # If version parsing fails, skip this version
-                        pass
+                        continue
+                    if highest_version is None or parsed_version > highest_version:
+                        highest_version = parsed_version
+                        highest_original = v.original
 
-            if exact_versions:
+            if highest_version is not None:
                 # Use the highest exact version
-                consolidated[pkg_name] = max(exact_versions, key=lambda x: x[0])[1]
+                consolidated[pkg_name] = highest_original
             else:
                 # No exact versions, use the first one
-                consolidated[pkg_name] = versions[0]["original"]
+                consolidated[pkg_name] = versions[0].original
 
-    return consolidated
+    # Return packages in the order they are written to the requirements file
+    return dict(sorted(consolidated.items()))
+
+
+def _write_text_file(filepath, text):
+    """Write text to filepath through a raw file descriptor, bypassing TextIOWrapper."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
 
 def write_requirements_files(profiles, output_dir):
@@ -160,9 +148,8 @@ def write_requirements_files(profiles, output_dir):
 
         filepath = os.path.join(output_dir, filename)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            for pkg_name in sorted(consolidated.keys()):
-                f.write(f"{consolidated[pkg_name]}\n")
+        body = "".join(f"{requirement}\n" for requirement in consolidated.values())
+        _write_text_file(filepath, body)
 
         files_created.append(filepath)
         print(f"✅ Created {filepath} with {len(consolidated)} packages")
@@ -195,17 +182,16 @@ def main():
 
         # Write a list of all requirements files for WhiteSource scanning
         files_list_path = os.path.join(output_dir, "requirements-files.txt")
-        with open(files_list_path, "w", encoding="utf-8") as f:
-            for file_path in files_created:
-                f.write(f"{os.path.basename(file_path)}\n")
+        _write_text_file(
+            files_list_path,
+            "".join(f"{os.path.basename(p)}\n" for p in files_created),
+        )
 
         print(f"📝 Created file list: {files_list_path}")
         return 0
 
     except Exception as e:
         print(f"❌ Error generating requirements: {e}")
-        import traceback
-
         traceback.print_exc()
         return 1
 
@@ -3,68 +3,25 @@
 Validate pyproject.toml for conflicting dependencies across profiles.
 """
 
-import re
 import sys
+import traceback
 import argparse
 from collections import defaultdict
-from packaging import version
-import toml
-
-
-def parse_dependency(dep_string):
-    """Parse a dependency string to extract package name, operator, and version."""
-    # Handle platform/environment markers
-    if ";" in dep_string:
-        dep_part = dep_string.split(";")[0].strip()
-        marker = dep_string.split(";")[1].strip()
-    else:
-        dep_part = dep_string.strip()
-        marker = None
-
-    # Match package name with version specifier
-    match = re.match(r"^([a-zA-Z0-9_.-]+)(==|>=|<=|>|<|!=|~=)(.+)$", dep_part)
-    if match:
-        pkg_name, operator, pkg_version = match.groups()
-        return (
-            pkg_name.lower().replace("_", "-").replace(".", "-"),
-            operator,
-            pkg_version.strip(),
-            marker,
-        )
-    else:
-        # No version specified
-        pkg_name = dep_part.lower().replace("_", "-").replace(".", "-")
-        return pkg_name, None, None, marker
+
+from _pyproject_common import (
+    DEV_PROFILE_NAMES,
+    ParsedDep,
+    load_pyproject,
+    parse_dependency,
+)
 
 
 def extract_dependencies(pyproject_file):
     """Extract all dependencies from pyproject.toml organized by profile."""
-    with open(pyproject_file, "r", encoding="utf-8") as f:
-        data = toml.load(f)
+    data = load_pyproject(pyproject_file)
 
     all_deps = {}
 
-    # Define development-related profile names to skip
-    dev_profile_names = {
-        "dev",
-        "development",
-        "develop",
-        "test",
-        "testing",
-        "tests",
-        "lint",
-        "linting",
-        "format",
-        "formatting",
-        "docs",
-        "documentation",
-        "build",
-        "ci",
-        "cd",
-        "debug",
-        "local",
-    }
-
     # Main dependencies
     if "project" in data and "dependencies" in data["project"]:
         all_deps["main"] = data["project"]["dependencies"]
@@ -73,7 +30,7 @@ def extract_dependencies(pyproject_file):
     if "project" in data and "optional-dependencies" in data["project"]:
         for profile_name, deps in data["project"]["optional-dependencies"].items():
             # Skip development-related profiles
-            if profile_name.lower() not in dev_profile_names:
+            if profile_name.lower() not in DEV_PROFILE_NAMES:
                 all_deps[profile_name] = deps
             else:
                 print(f"⏭️  Skipping dev profile: {profile_name}")
@@ -91,13 +48,7 @@ def find_conflicts(all_deps):
             try:
                 pkg_name, operator, pkg_version, marker = parse_dependency(dep)
                 parsed_deps[profile].append(
-                    {
-                        "original": dep,
-                        "package": pkg_name,
-                        "operator": operator,
-                        "version": pkg_version,
-                        "marker": marker,
-                    }
+                    ParsedDep(pkg_name, operator, pkg_version, marker, dep)
                 )
             except Exception as e:
                 print(
@@ -108,59 +59,28 @@ def find_conflicts(all_deps):
     package_map = defaultdict(list)
     for profile, deps in parsed_deps.items():
         for dep in deps:
-            package_map[dep["package"]].append((profile, dep))
+            package_map[dep.package].append((profile, dep))
 
-    # Find conflicts
+    # Find conflicts: a package pinned (==) to more than one version across
+    # profiles. Mixed operators alone (e.g. == vs >=) are not a conflict.
     conflicts = []
     for pkg_name, occurrences in package_map.items():
-        if len(occurrences) > 1:
-            # Check if there are actual version conflicts
-            versions = {}
-            for profile, dep in occurrences:
-                if dep["operator"] == "==" and dep["version"]:
-                    if dep["version"] not in versions:
-                        versions[dep["version"]] = []
-                    versions[dep["version"]].append((profile, dep))
-
-            # If we have multiple exact versions, it's a conflict
-            if len(versions) > 1:
-                conflicts.append(
-                    {
-                        "package": pkg_name,
-                        "versions": versions,
-                        "all_occurrences": occurrences,
-                    }
-                )
-            # Also check for mixed operators (e.g., == vs >=)
-            elif len(occurrences) > 1:
-                operators = set()
-                for profile, dep in occurrences:
-                    if dep["operator"]:
-                        operators.add(f"{dep['operator']}{dep['version']}")
-
-                if len(operators) > 1:
-                    # Potential conflict with different operators
-                    exact_versions = [
-                        (profile, dep)
-                        for profile, dep in occurrences
-                        if dep["operator"] == "=="
-                    ]
-                    if len(exact_versions) > 1:
-                        version_set = set()
-                        for profile, dep in exact_versions:
-                            version_set.add(dep["version"])
-
-                        if len(version_set) > 1:
-                            conflicts.append(
-                                {
-                                    "package": pkg_name,
-                                    "versions": {
-                                        dep["version"]: [(profile, dep)]
-                                        for profile, dep in exact_versions
-                                    },
-                                    "all_occurrences": occurrences,
-                                }
-                            )
+        if len(occurrences) < 2:
+            continue
+
+        versions = defaultdict(list)
+        for profile, dep in occurrences:
+            if dep.operator == "==" and dep.version:
+                versions[dep.version].append((profile, dep))
+
+        if len(versions) > 1:
+            conflicts.append(
+                {
+                    "package": pkg_name,
+                    "versions": versions,
+                    "all_occurrences": occurrences,
+                }
+            )
 
     return conflicts
 
@@ -185,11 +105,11 @@ def format_conflict_report(conflicts):
                     f"   Version {version_str} found in profiles: {', '.join(profiles)}"
                 )
                 for profile, dep in occurrences:
-                    report.append(f"     - {profile}: {dep['original']}")
+                    report.append(f"     - {profile}: {dep.original}")
         else:
             report.append("   Different version constraints:")
             for profile, dep in conflict["all_occurrences"]:
-                report.append(f"     - {profile}: {dep['original']}")
+                report.append(f"     - {profile}: {dep.original}")
 
         report.append("")
 
@@ -206,6 +126,20 @@ def format_conflict_report(conflicts):
     return "\n".join(report)
 
 
+def format_detailed_analysis(all_deps):
+    """Format the per-profile dependency listing appended by --detailed."""
+    separator = "=" * 60
+    analysis = [f"\n\n{separator}\nDETAILED ANALYSIS\n{separator}\n\n"]
+
+    for profile, deps in all_deps.items():
+        analysis.append(f"Profile: {profile}\n")
+        analysis.append("-" * (len(profile) + 9) + "\n")
+        analysis.extend(f"  {dep}\n" for dep in deps)
+        analysis.append("\n")
+
+    return "".join(analysis)
+
+
 def main():
     """Main validation function."""
     parser = argparse.ArgumentParser(
@@ -245,29 +179,17 @@ def main():
         print(report)
 
         # Write detailed report to file
+        if args.detailed:
+            report += format_detailed_analysis(all_deps)
         with open(args.output, "w", encoding="utf-8") as f:
             f.write(report)
 
-            if args.detailed:
-                f.write("\n\n" + "=" * 60 + "\n")
-                f.write("DETAILED ANALYSIS\n")
-                f.write("=" * 60 + "\n\n")
-
-                for profile, deps in all_deps.items():
-                    f.write(f"Profile: {profile}\n")
-                    f.write("-" * (len(profile) + 9) + "\n")
-                    for dep in deps:
-                        f.write(f"  {dep}\n")
-                    f.write("\n")
-
         print(f"📄 Report written to: {args.output}")
 
         return 1 if conflicts else 0
 
     except Exception as e:
         print(f"❌ Error validating dependencies: {e}")
-        import traceback
-
         traceback.print_exc()
         return 1
 
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import re
 import sys
 import time
 from os import getenv
 from pathlib import Path
+from typing import NamedTuple
 from urllib.parse import quote
 from packaging import version
 
@@ -17,9 +19,38 @@ from gql.transport.requests import RequestsHTTPTransport
 # Constants
 DEFAULT_VERSION_CONFIG_FILE = ".versionrc.json"
 
+# Conventional commit subjects: "type(scope): subject (#PR)" or "type: subject (#PR)"
+_COMMIT_RE = re.compile(r"^(\w+)(?:\(([^)]+)\))?: (.+?)(?:\s+\(#(\d+)\))?$")
+
+# Semantic version at the end of a custom section tag, e.g. "ui-v1.2.3-rc.1"
+_TAG_VERSION_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+\S*$")
+
+# Punctuation left behind at either end after stripping issue references
+_SUBJECT_SEPARATORS = (",", "-", ":")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_from(config_path: str, mtime_ns: int) -> dict:
+    """Parse a config file; cached per path and modification time"""
+    with open(config_path) as f:
+        config = json.load(f)
+
+    # Ensure required fields exist
+    if "types" not in config:
+        config["types"] = [
+            {"type": "feat", "section": "Features"},
+            {"type": "fix", "section": "Bug Fixes"},
+        ]
+
+    return config
+
 
 def load_version_config(config_file_path: str = DEFAULT_VERSION_CONFIG_FILE) -> dict:
-    """Load configuration from specified config file or default configuration file"""
+    """Load configuration from specified config file or default configuration file
+
+    A loaded config file is parsed at most once per process; the returned dict is
+    shared between callers and must not be mutated.
+    """
     # Try GitHub Actions workspace first, then current directory
     workspace_path = Path(f"/github/workspace/{config_file_path}")
     local_path = Path(config_file_path)
@@ -45,17 +76,8 @@ def load_version_config(config_file_path: str = DEFAULT_VERSION_CONFIG_FILE) ->
         }
 
     try:
-        with open(config_path) as f:
-            config = json.load(f)
-
-        # Ensure required fields exist
-        if "types" not in config:
-            config["types"] = [
-                {"type": "feat", "section": "Features"},
-                {"type": "fix", "section": "Bug Fixes"},
-            ]
-
-        return config
+        config_path = config_path.resolve()
+        return _load_config_from(str(config_path), config_path.stat().st_mtime_ns)
     except (json.JSONDecodeError, OSError) as e:
         print(f"Error reading {config_file_path}: {e}")
         sys.exit(1)
@@ -93,6 +115,12 @@ def _create_graphql_client(github_token: str) -> Client:
     return Client(transport=transport)
 
 
+@functools.lru_cache(maxsize=1)
+def _github_rest_session() -> requests.Session:
+    """Shared HTTP session so REST calls reuse one keep-alive connection"""
+    return requests.Session()
+
+
 def _parse_version(tag_name: str) -> version.Version | None:
     """Parse semantic version from tag name, handling 'v' prefix"""
     try:
@@ -137,7 +165,7 @@ def _resolve_version_ref(github_token: str, repo_name: str, ref: str) -> str:
         url = (
             f"https://api.github.com/repos/{repo_name}/git/ref/tags/{encoded_candidate}"
         )
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _github_rest_session().get(url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             if candidate != ref:
@@ -186,7 +214,7 @@ def get_previous_release_tag(
             return None
 
         # Fetch releases (up to 100, should be enough for most repos)
-        response = requests.get(
+        response = _github_rest_session().get(
             url, headers=headers, params={"per_page": 100}, timeout=10
         )
 
@@ -278,12 +306,16 @@ def _extract_commit_from_node(node: dict) -> dict:
     if node["associatedPullRequests"]["nodes"]:
         pr_number = str(node["associatedPullRequests"]["nodes"][0]["number"])
 
-    # Build commit dict
+    # GitActor.name is nullable, so fall back the same way for a missing name
+    author = (node["author"] or {}).get("name") or "Unknown"
+
+    # Build commit dict; the handful of distinct author names repeat across
+    # every commit, so intern them rather than keep one copy per commit
     return {
         "hash": node["abbreviatedOid"],
         "full_hash": node["oid"],
         "subject": node["messageHeadline"],
-        "author": node["author"]["name"] if node["author"] else "Unknown",
+        "author": sys.intern(author),
         "pr_number": pr_number,
     }
 
@@ -297,7 +329,7 @@ def _extract_commit_from_compare_rest(commit: dict) -> dict:
         "hash": commit["sha"][:7],
         "full_hash": commit["sha"],
         "subject": commit_details.get("message", "").split("\n")[0],
-        "author": commit_author.get("name") or "Unknown",
+        "author": sys.intern(commit_author.get("name") or "Unknown"),
         "pr_number": None,
     }
 
@@ -306,7 +338,7 @@ def _fetch_rest_compare_page(
     url: str, headers: dict, page: int, per_page: int, from_ref: str, to_ref: str
 ) -> dict:
     """Fetch a single page from the REST compare API."""
-    response = requests.get(
+    response = _github_rest_session().get(
         url,
         headers=headers,
         params={"page": page, "per_page": per_page},
@@ -377,7 +409,7 @@ def _get_commits_with_compare_rest(
 
 
 _GRAPHQL_COMPARE_QUERY = gql("""
-query($owner: String!, $repo: String!, $baseRef: String!, $headRef: String!, $after: String) {
+query($owner: String!, $repo: String!, $baseRef: String!, $headRef: String!, $after: String, $includeTotal: Boolean!) {
   repository(owner: $owner, name: $repo) {
     baseTagRef: ref(qualifiedName: $baseRef) {
       compare(headRef: $headRef) {
@@ -386,7 +418,7 @@ query($owner: String!, $repo: String!, $baseRef: String!, $headRef: String!, $af
             hasNextPage
             endCursor
           }
-          totalCount
+          totalCount @include(if: $includeTotal)
           nodes {
             oid
             abbreviatedOid
@@ -469,6 +501,8 @@ def _get_commits_with_prs_graphql(
             "baseRef": from_ref,
             "headRef": to_ref,
             "after": cursor,
+            # The total only needs computing once, not on every page
+            "includeTotal": page_index == 0,
         }
 
         commits_data = _execute_graphql_with_retry(
@@ -477,14 +511,25 @@ def _get_commits_with_prs_graphql(
 
         nodes = commits_data["nodes"]
         print(f"Found {len(nodes)} commits on page {page_number}")
-        print(
-            f"Total commits in comparison: {commits_data.get('totalCount', 'unknown')}"
-        )
+        if page_index == 0:
+            print(
+                f"Total commits in comparison: {commits_data.get('totalCount', 'unknown')}"
+            )
+            total_count = commits_data.get("totalCount")
+            # Say up front when the page cap will cut the comparison short,
+            # rather than discovering it after the last allowed page
+            max_commits = len(nodes) * _MAX_GRAPHQL_PAGES
+            if total_count and nodes and total_count > max_commits:
+                print(
+                    f"Warning: {total_count} commits exceed the {_MAX_GRAPHQL_PAGES}-page "
+                    f"limit; only the first {max_commits} will be included"
+                )
 
         commits.extend(_extract_commit_from_node(node) for node in nodes)
 
         page_info = commits_data["pageInfo"]
-        if not page_info["hasNextPage"]:
+        # A missing cursor would restart from the first page, so stop instead
+        if not page_info["hasNextPage"] or not page_info["endCursor"]:
             break
         cursor = page_info["endCursor"]
 
@@ -492,15 +537,85 @@ def _get_commits_with_prs_graphql(
     return commits
 
 
-def _build_commit_dict(commit, pr_number: str | None) -> dict[str, str]:
-    """Build commit dictionary from commit object"""
-    return {
-        "hash": commit.sha[:7],
-        "full_hash": commit.sha,
-        "subject": commit.commit.message.split("\n")[0],
-        "author": commit.commit.author.name if commit.commit.author else "Unknown",
-        "pr_number": pr_number,
-    }
+_GRAPHQL_PR_LOOKUP_BATCH_SIZE = 100
+
+
+@functools.lru_cache(maxsize=None)
+def _build_pr_lookup_query(batch_size: int):
+    """Build one GraphQL document resolving the first associated PR for each SHA.
+
+    Each commit is looked up through an aliased ``object(oid: $sN)`` field so a
+    whole batch of commits costs a single round trip. The SHAs are passed as
+    variables, so the parsed document is shared by every batch of the same size.
+    """
+    variables = "".join(f", $s{index}: GitObjectID!" for index in range(batch_size))
+    fields = "\n".join(
+        f"    c{index}: object(oid: $s{index}) {{\n"
+        "      ... on Commit {\n"
+        "        associatedPullRequests(first: 1) {\n"
+        "          nodes {\n"
+        "            number\n"
+        "          }\n"
+        "        }\n"
+        "      }\n"
+        "    }"
+        for index in range(batch_size)
+    )
+    return gql(
+        f"query($owner: String!, $repo: String!{variables}) {{\n"
+        "  repository(owner: $owner, name: $repo) {\n"
+        f"{fields}\n"
+        "  }\n"
+        "}"
+    )
+
+
+def _get_pr_numbers_graphql(
+    graphql_client: Client, repo_name: str, shas: list[str]
+) -> dict[str, str]:
+    """Resolve associated PR numbers for commits, batching SHAs per GraphQL query.
+
+    A failed batch is skipped, so numbers resolved by other batches are kept.
+    """
+    owner, repo = repo_name.split("/")
+    pr_numbers: dict[str, str] = {}
+
+    for start in range(0, len(shas), _GRAPHQL_PR_LOOKUP_BATCH_SIZE):
+        batch = shas[start : start + _GRAPHQL_PR_LOOKUP_BATCH_SIZE]
+        print(f"Resolving PR numbers for {len(batch)} commits using GraphQL...")
+        variables = {"owner": owner, "repo": repo}
+        variables.update((f"s{index}", sha) for index, sha in enumerate(batch))
+        try:
+            result = graphql_client.execute(
+                _build_pr_lookup_query(len(batch)), variable_values=variables
+            )
+        except Exception as e:
+            print(f"Warning: Could not resolve PR numbers using GraphQL: {e}")
+            continue
+        repo_data = result.get("repository") or {}
+
+        for index, sha in enumerate(batch):
+            node = repo_data.get(f"c{index}") or {}
+            pr_nodes = (node.get("associatedPullRequests") or {}).get("nodes")
+            if pr_nodes:
+                pr_numbers[sha] = str(pr_nodes[0]["number"])
+
+    return pr_numbers
+
+
+def _attach_pr_numbers(
+    graphql_client: Client, repo_name: str, commits: list[dict[str, str]]
+) -> None:
+    """Fill in missing PR numbers in place; leaves them unset where the lookup fails."""
+    shas = [commit["full_hash"] for commit in commits if not commit["pr_number"]]
+    if not shas:
+        return
+
+    pr_numbers = _get_pr_numbers_graphql(graphql_client, repo_name, shas)
+    for commit in commits:
+        if not commit["pr_number"]:
+            commit["pr_number"] = pr_numbers.get(commit["full_hash"])
+    print(f"Resolved PR numbers for {len(pr_numbers)} of {len(shas)} commits")
 
 
 def _fetch_commits_with_fallback(
@@ -517,10 +632,12 @@ def _fetch_commits_with_fallback(
         )
     except GraphQLCompareError as e:
         print(f"Warning: {e}")
-        print("Falling back to REST compare API without PR association.")
-        return _get_commits_with_compare_rest(
+        print("Falling back to REST compare API with batched PR association.")
+        commits = _get_commits_with_compare_rest(
             github_token, github_repo, from_ref, to_ref
         )
+        _attach_pr_numbers(graphql_client, github_repo, commits)
+        return commits
 
 
 def _resolve_fallback_base_ref(
@@ -556,82 +673,120 @@ def get_commits_between_refs(from_ref: str, to_ref: str) -> list[dict[str, str]]
     tag as a fallback for from_ref.
     """
     github_token, github_repo = _validate_environment()
-    graphql_client = _create_graphql_client(github_token)
 
-    resolved_from_ref = _resolve_version_ref(github_token, github_repo, from_ref)
-    resolved_to_ref = _resolve_version_ref(github_token, github_repo, to_ref)
-    if resolved_from_ref != from_ref or resolved_to_ref != to_ref:
-        print(f"Using resolved refs: {resolved_from_ref} -> {resolved_to_ref}")
+    # Keep one GraphQL session, and its HTTP connection, open for every query
+    with _create_graphql_client(github_token) as graphql_client:
+        resolved_from_ref = _resolve_version_ref(github_token, github_repo, from_ref)
+        resolved_to_ref = _resolve_version_ref(github_token, github_repo, to_ref)
+        if resolved_from_ref != from_ref or resolved_to_ref != to_ref:
+            print(f"Using resolved refs: {resolved_from_ref} -> {resolved_to_ref}")
 
-    try:
-        commits = _fetch_commits_with_fallback(
-            graphql_client,
-            github_token,
-            github_repo,
-            resolved_from_ref,
-            resolved_to_ref,
+        try:
+            commits = _fetch_commits_with_fallback(
+                graphql_client,
+                github_token,
+                github_repo,
+                resolved_from_ref,
+                resolved_to_ref,
+            )
+            print(f"Processing {len(commits)} commits...")
+            return commits
+        except RefNotFoundError as e:
+            if not e.is_base_ref:
+                print(f"Error: Could not find head ref '{e.ref}'")
+                print(f"Please ensure the tag/ref '{e.ref}' exists")
+                sys.exit(1)
+
+        # Base ref not found — attempt fallback to previous release tag
+        fallback_from = _resolve_fallback_base_ref(
+            github_token, github_repo, from_ref, to_ref
         )
-        print(f"Processing {len(commits)} commits...")
-        return commits
-    except RefNotFoundError as e:
-        if not e.is_base_ref:
-            print(f"Error: Could not find head ref '{e.ref}'")
-            print(f"Please ensure the tag/ref '{e.ref}' exists")
+        try:
+            commits = _fetch_commits_with_fallback(
+                graphql_client,
+                github_token,
+                github_repo,
+                fallback_from,
+                resolved_to_ref,
+            )
+            print(f"Processing {len(commits)} commits...")
+            return commits
+        except RefNotFoundError as retry_error:
+            print(f"Error: Fallback also failed: {retry_error}")
+            print(f"Could not find ref '{retry_error.ref}'")
             sys.exit(1)
 
-    # Base ref not found — attempt fallback to previous release tag
-    fallback_from = _resolve_fallback_base_ref(
-        github_token, github_repo, from_ref, to_ref
-    )
-    try:
-        commits = _fetch_commits_with_fallback(
-            graphql_client,
-            github_token,
-            github_repo,
-            fallback_from,
-            resolved_to_ref,
-        )
-        print(f"Processing {len(commits)} commits...")
-        return commits
-    except RefNotFoundError as retry_error:
-        print(f"Error: Fallback also failed: {retry_error}")
-        print(f"Could not find ref '{retry_error.ref}'")
-        sys.exit(1)
-
 
 def parse_commit_message(
     subject: str,
 ) -> tuple[str | None, str | None, str, str | None]:
     """Parse commit message and return (type, scope, clean_subject, pr_number)"""
-    # Format 1: type(scope): subject (#PR)
-    match1 = re.match(r"^(\w+)\(([^)]+)\): (.+?)(?:\s+\(#(\d+)\))?$", subject)
-    if match1:
-        return match1.group(1), match1.group(2), match1.group(3), match1.group(4)
+    # Every conventional subject contains ": "; skip the regex for the rest
+    if ": " not in subject:
+        return None, None, subject, None
 
-    # Format 2: type: subject (#PR)
-    match2 = re.match(r"^(\w+): (.+?)(?:\s+\(#(\d+)\))?$", subject)
-    if match2:
-        return match2.group(1), None, match2.group(2), match2.group(3)
+    # Both formats in one match; the scope group is None when absent
+    match = _COMMIT_RE.match(subject)
+    if match:
+        return match.groups()
 
     return None, None, subject, None
 
 
+class _IssuePatterns(NamedTuple):
+    """Compiled issue-reference patterns for one set of configured prefixes"""
+
+    any_issue: re.Pattern
+    # (pattern, replacement) pairs, applied in order by clean_subject
+    cleanup: tuple[tuple[re.Pattern, str], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_issue_patterns(prefixes: tuple[str, ...]) -> _IssuePatterns:
+    """Compile issue patterns once per distinct issuePrefixes configuration"""
+    # Create a pattern that matches any of the configured prefixes; digits are
+    # matched atomically so a reference is never split in two
+    prefixes_pattern = "|".join(re.escape(prefix) for prefix in prefixes)
+    issue_pattern = f"(?:{prefixes_pattern})\\d+(?!\\d)"
+
+    # Each step sees the output of the previous one, so the order matters
+    # (e.g. "and ISSUE-XXX" pairs go before "ISSUE-XXX - ")
+    cleanup_steps = (
+        # Remove "ISSUE-XXX: " at the beginning
+        (f"^{issue_pattern}:\\s*", ""),
+        # Remove "and ISSUE-XXX " at the beginning (special case)
+        (f"^and\\s+{issue_pattern}\\s*", ""),
+        # Remove "and ISSUE-XXX - " at the beginning (special case with dash)
+        (f"^and\\s+{issue_pattern}\\s*-\\s*", ""),
+        # Remove "and ISSUE-XXX " in the middle (with surrounding spaces)
+        (f"\\s+and\\s+{issue_pattern}\\s*", " "),
+        # Remove "ISSUE-XXX - " (with dash and spaces)
+        (f"{issue_pattern}\\s*-\\s*", ""),
+        # Remove "ISSUE-XXX: " anywhere in the string
+        (f"{issue_pattern}:\\s*", ""),
+        # Remove standalone "ISSUE-XXX" references
+        (f"\\s*{issue_pattern}\\s*", " "),
+    )
+
+    return _IssuePatterns(
+        # Any configured reference (e.g., "ISSUE-" -> "ISSUE-\d+")
+        any_issue=re.compile(issue_pattern),
+        cleanup=tuple(
+            (re.compile(pattern), replacement) for pattern, replacement in cleanup_steps
+        ),
+    )
+
+
 def extract_issue_numbers(text: str, config: dict) -> list[str]:
     """Extract issue numbers from text based on configured prefixes"""
     # Only extract issues if issuePrefixes is configured
     if "issuePrefixes" not in config or not config["issuePrefixes"]:
         return []
 
-    all_issues = []
-
-    for prefix in config["issuePrefixes"]:
-        # Create pattern for this prefix (e.g., "ISSUE-" -> "ISSUE-\d+")
-        prefix_pattern = re.escape(prefix) + r"\d+"
-        pattern = re.compile(prefix_pattern)
-        matches = pattern.findall(text)
-        all_issues.extend(matches)
+    patterns = _compile_issue_patterns(tuple(config["issuePrefixes"]))
+    all_issues = patterns.any_issue.findall(text)
 
-    return list(set(all_issues))  # Remove duplicates
+    return list(dict.fromkeys(all_issues))  # Remove duplicates, keeping text order
 
 
 def clean_subject(subject: str, config: dict) -> str:
@@ -641,39 +796,19 @@ def clean_subject(subject: str, config: dict) -> str:
         return subject
 
     clean_subj = subject
-
-    # Create a pattern that matches any of the configured prefixes
-    prefixes_pattern = "|".join(re.escape(prefix) for prefix in config["issuePrefixes"])
-    issue_pattern = f"({prefixes_pattern})\\d+"
+    patterns = _compile_issue_patterns(tuple(config["issuePrefixes"]))
 
     # Check if any issue references exist in the subject
-    if re.search(issue_pattern, subject):
-        # Pattern 1: Remove "ISSUE-XXX: " at the beginning
-        clean_subj = re.sub(f"^{issue_pattern}:\\s*", "", clean_subj)
-
-        # Pattern 2: Remove "and ISSUE-XXX " at the beginning (special case)
-        clean_subj = re.sub(f"^and\\s+{issue_pattern}\\s*", "", clean_subj)
-
-        # Pattern 3: Remove "and ISSUE-XXX - " at the beginning (special case with dash)
-        clean_subj = re.sub(f"^and\\s+{issue_pattern}\\s*-\\s*", "", clean_subj)
-
-        # Pattern 4: Remove "and ISSUE-XXX " in the middle (with surrounding spaces)
-        clean_subj = re.sub(f"\\s+and\\s+{issue_pattern}\\s*", " ", clean_subj)
-
-        # Pattern 5: Remove "ISSUE-XXX - " (with dash and spaces)
-        clean_subj = re.sub(f"{issue_pattern}\\s*-\\s*", "", clean_subj)
-
-        # Pattern 6: Remove "ISSUE-XXX: " anywhere in the string
-        clean_subj = re.sub(f"{issue_pattern}:\\s*", "", clean_subj)
-
-        # Pattern 7: Remove standalone "ISSUE-XXX" references
-        clean_subj = re.sub(f"\\s*{issue_pattern}\\s*", " ", clean_subj)
+    if patterns.any_issue.search(subject):
+        for pattern, replacement in patterns.cleanup:
+            clean_subj = pattern.sub(replacement, clean_subj)
 
         # Clean up extra spaces and punctuation
-        clean_subj = re.sub(r"\s+", " ", clean_subj)  # Multiple spaces to single space
-        clean_subj = re.sub(r"^\s*[,\-:]\s*", "", clean_subj)  # Leading punctuation
-        clean_subj = re.sub(r"\s*[,\-:]\s*$", "", clean_subj)  # Trailing punctuation
-        clean_subj = clean_subj.strip()
+        clean_subj = " ".join(clean_subj.split())  # Multiple spaces to single space
+        if clean_subj.startswith(_SUBJECT_SEPARATORS):  # Leading punctuation
+            clean_subj = clean_subj[1:].lstrip()
+        if clean_subj.endswith(_SUBJECT_SEPARATORS):  # Trailing punctuation
+            clean_subj = clean_subj[:-1].rstrip()
 
     return clean_subj
 
@@ -706,20 +841,33 @@ def _get_custom_sections_config(config: dict) -> dict:
     return custom_sections
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_bump_patterns(
+    bump_commit_pattern: str, tag_prefix: str
+) -> tuple[re.Pattern, re.Pattern | None]:
+    """Compile a custom section's bump-commit and version patterns once per config"""
+    bump_re = re.compile(bump_commit_pattern, re.IGNORECASE)
+    version_re = None
+    if tag_prefix:
+        version_re = re.compile(
+            f"{re.escape(tag_prefix)}([0-9]+\\.[0-9]+\\.[0-9]+[^\\s]*)"
+        )
+    return bump_re, version_re
+
+
 def _is_custom_bump_commit(commit: dict, section_config: dict) -> str | None:
     """Check if commit is a custom section bump commit and return the version if so"""
     if not section_config or not section_config.get("bumpCommitPattern"):
         return None
 
-    pattern = section_config["bumpCommitPattern"]
-    if re.search(pattern, commit["subject"], re.IGNORECASE):
+    tag_prefix = section_config.get("tagPrefix", "")
+    bump_re, version_re = _compile_bump_patterns(
+        section_config["bumpCommitPattern"], tag_prefix
+    )
+    if bump_re.search(commit["subject"]):
         # Extract version from commit subject
-        tag_prefix = section_config.get("tagPrefix", "")
         if tag_prefix:
-            version_match = re.search(
-                f"{re.escape(tag_prefix)}([0-9]+\\.[0-9]+\\.[0-9]+[^\\s]*)",
-                commit["subject"],
-            )
+            version_match = version_re.search(commit["subject"])
             if version_match:
                 return f"{tag_prefix}{version_match.group(1)}"
         else:
@@ -735,39 +883,48 @@ def _is_custom_bump_commit(commit: dict, section_config: dict) -> str | None:
 def _process_custom_bump_commit(
     i: int,
     commits: list[dict],
+    bump_versions: list[str | None],
     section_name: str,
-    section_config: dict,
-    custom_commits: list[dict],
+    custom_commits: dict[int, dict],
     custom_versions: list[str],
 ) -> None:
     """Process a custom section bump commit and identify the preceding change commit"""
-    commit = commits[i]
-    version = _is_custom_bump_commit(commit, section_config)
-
-    if not version:
-        return
-
-    custom_versions.append(version)
-    print(f"Found {section_name} bump commit: {version}")
+    bump_version = bump_versions[i]
+    custom_versions.append(bump_version)
+    print(f"Found {section_name} bump commit: {bump_version}")
 
     # The previous commit (if exists) is the change commit
     if i > 0:
         change_commit = commits[i - 1]
         # Only add if it's not already a custom commit and not a bump commit
-        if change_commit not in custom_commits and not _is_custom_bump_commit(
-            change_commit, section_config
-        ):
-            custom_commits.append(change_commit)
+        if id(change_commit) not in custom_commits and not bump_versions[i - 1]:
+            custom_commits[id(change_commit)] = change_commit
             print(
                 f"  -> {section_name} change commit: {change_commit['hash']} {change_commit['subject'][:50]}..."
             )
 
 
+def _parse_custom_version(tag: str) -> version.Version | None:
+    """Parse the semantic version at the end of a custom section tag"""
+    match = _TAG_VERSION_RE.search(tag)
+    if not match:
+        return None
+    try:
+        return version.parse(match.group())
+    except version.InvalidVersion:
+        return None
+
+
 def _create_version_range(versions: list[str]) -> str:
     """Create version range string from versions"""
-    versions.sort()
-    oldest_version = versions[0]
-    newest_version = versions[-1]
+    # Order by semantic version so "ui-v0.10.0" sorts after "ui-v0.9.1"; fall
+    # back to plain string order if any tag has no parseable version
+    keys = [_parse_custom_version(tag) for tag in versions]
+    if None in keys:
+        keys = versions
+    indexes = range(len(versions))
+    oldest_version = versions[min(indexes, key=keys.__getitem__)]
+    newest_version = versions[max(indexes, key=keys.__getitem__)]
 
     if oldest_version != newest_version:
         return f"{oldest_version} → {newest_version}"
@@ -779,21 +936,25 @@ def _process_section_commits(
     commits: list[dict], section_name: str, section_config: dict
 ) -> tuple[list[dict], list[str]]:
     """Process commits for a single custom section"""
-    custom_commits = []
+    # Check every commit once; change commits are found by index from here
+    bump_versions = [
+        _is_custom_bump_commit(commit, section_config) for commit in commits
+    ]
+    custom_commits = {}  # id(commit) -> commit, in discovery order
     custom_versions = []
 
-    for i, commit in enumerate(commits):
-        if _is_custom_bump_commit(commit, section_config):
+    for i, bump_version in enumerate(bump_versions):
+        if bump_version:
             _process_custom_bump_commit(
                 i,
                 commits,
+                bump_versions,
                 section_name,
-                section_config,
                 custom_commits,
                 custom_versions,
             )
 
-    return custom_commits, custom_versions
+    return list(custom_commits.values()), custom_versions
 
 
 def _build_section_title(section_name: str, version_range: str) -> str:
@@ -818,7 +979,7 @@ def _detect_custom_changes(
     if not custom_sections_config:
         return commits, {}
 
-    all_custom_commits = []
+    custom_commit_ids = set()
     custom_changes_by_section = {}
 
     print(
@@ -836,13 +997,13 @@ def _detect_custom_changes(
             version_range = _create_version_range(custom_versions)
             section_title = _build_section_title(section_name, version_range)
             custom_changes_by_section[section_title] = custom_commits
-            all_custom_commits.extend(custom_commits)
+            custom_commit_ids.update(map(id, custom_commits))
             print(
                 f"Grouped {len(custom_commits)} {section_name} commits under range: {version_range}"
             )
 
     # Separate non-custom commits
-    non_custom_commits = [c for c in commits if c not in all_custom_commits]
+    non_custom_commits = [c for c in commits if id(c) not in custom_commit_ids]
 
     return non_custom_commits, custom_changes_by_section
 
@@ -852,16 +1013,15 @@ def _detect_custom_changes(
 
 def _create_empty_type_sections(config: dict) -> dict:
     """Create empty type sections from config"""
-    type_sections = {}
-    for type_config in config["types"]:
-        type_sections[type_config["type"]] = {
-            "section": type_config["section"],
-            "commits": [],
-        }
-    return type_sections
+    return {
+        type_config["type"]: {"section": type_config["section"], "commits": []}
+        for type_config in config["types"]
+    }
 
 
-def _process_single_commit(commit: dict, config: dict) -> dict | None:
+def _process_single_commit(
+    commit: dict, config: dict, known_types: dict
+) -> dict | None:
     """Process a single commit and return processed commit dict or None if should be skipped"""
     # Skip release commits
     if "[ci skip]" in commit["subject"]:
@@ -870,7 +1030,8 @@ def _process_single_commit(commit: dict, config: dict) -> dict | None:
     # Parse commit message
     commit_type, scope, subject, pr_number = parse_commit_message(commit["subject"])
 
-    if not commit_type:
+    # Skip unknown types before doing any issue-reference work
+    if commit_type not in known_types:
         return None
 
     # Extract issue numbers and clean subject
@@ -893,12 +1054,17 @@ def _add_commits_to_sections(
     commits: list[dict], config: dict, type_sections: dict
 ) -> None:
     """Add processed commits to their respective type sections"""
+    # Index the commit lists directly so each append is a single lookup
+    commits_by_type = {
+        commit_type: type_data["commits"]
+        for commit_type, type_data in type_sections.items()
+    }
+
     for commit in commits:
-        processed_commit = _process_single_commit(commit, config)
-        if processed_commit and processed_commit["type"] in type_sections:
+        processed_commit = _process_single_commit(commit, config, commits_by_type)
+        if processed_commit:
             # Remove 'type' key before adding to section
-            commit_type = processed_commit.pop("type")
-            type_sections[commit_type]["commits"].append(processed_commit)
+            commits_by_type[processed_commit.pop("type")].append(processed_commit)
 
 
 def process_commits(commits: list[dict], config: dict) -> tuple[dict, dict]:
@@ -935,12 +1101,12 @@ def _format_commit_hash(commit: dict, repo_url: str) -> str:
     return f"* {commit['subject']}"
 
 
-def _add_pr_reference(line: str, commit: dict, repo_url: str) -> str:
-    """Add PR reference to the line if present"""
+def _format_pr_reference(commit: dict, repo_url: str) -> str:
+    """Format PR reference portion of the line, empty if there is no PR"""
     if commit["pr_number"]:
         pr_url = f"{repo_url}/pull/{commit['pr_number']}"
-        return line + f" ([#{commit['pr_number']}]({pr_url}))"
-    return line
+        return f" ([#{commit['pr_number']}]({pr_url}))"
+    return ""
 
 
 def _should_add_issue_links(commit: dict, config: dict) -> bool:
@@ -972,89 +1138,94 @@ def _build_issue_links(commit: dict, config: dict) -> list[str]:
     return issue_links
 
 
-def format_commit_line(commit: dict, config: dict) -> str:
+def format_commit_line(commit: dict, config: dict, repo_url: str | None = None) -> str:
     """Format a single commit line for release notes"""
-    repo_url = _get_repo_url()
-    line = _format_commit_hash(commit, repo_url)
-    line = _add_pr_reference(line, commit, repo_url)
-
-    # Add author information
-    line += f" ({commit['author']})"
+    if repo_url is None:
+        repo_url = _get_repo_url()
+    parts = [
+        _format_commit_hash(commit, repo_url),
+        _format_pr_reference(commit, repo_url),
+        # Add author information
+        f" ({commit['author']})",
+    ]
 
     # Add issue references if configured
     if _should_add_issue_links(commit, config):
         issue_links = _build_issue_links(commit, config)
         if issue_links:
-            line += f" ({', '.join(issue_links)})"
+            parts.append(f" ({', '.join(issue_links)})")
 
-    return line
+    return "".join(parts)
 
 
 def _generate_section_for_type(
-    type_data: dict, config: dict, header_prefix: str = "##"
+    type_data: dict, config: dict, repo_url: str, header_prefix: str = "##"
 ) -> str:
     """Generate a section for a specific commit type"""
     if not type_data["commits"]:
         return ""
 
-    section = f"{header_prefix} {type_data['section']}\n\n"
+    lines = [f"{header_prefix} {type_data['section']}\n"]
     for commit in type_data["commits"]:
-        commit_line = format_commit_line(commit, config)
-        section += commit_line + "\n"
-    section += "\n"
-    return section
+        lines.append(format_commit_line(commit, config, repo_url))
+    lines.append("\n")
+    return "\n".join(lines)
 
 
-def _generate_main_sections(type_sections: dict, config: dict) -> tuple[str, bool]:
+def _generate_main_sections(
+    type_sections: dict, config: dict, repo_url: str
+) -> tuple[str, bool]:
     """Generate main commit sections and return (content, has_commits)"""
-    content = ""
-    has_commits = False
+    sections = []
 
     for type_config in config["types"]:
         commit_type = type_config["type"]
         if commit_type in type_sections:
             type_data = type_sections[commit_type]
-            section = _generate_section_for_type(type_data, config)
+            section = _generate_section_for_type(type_data, config, repo_url)
             if section:
-                has_commits = True
-                content += section
+                sections.append(section)
 
-    return content, has_commits
+    return "".join(sections), bool(sections)
 
 
-def _generate_custom_sections(custom_sections: dict, config: dict) -> tuple[str, bool]:
+def _generate_custom_sections(
+    custom_sections: dict, config: dict, repo_url: str
+) -> tuple[str, bool]:
     """Generate custom commit sections and return (content, has_commits)"""
-    content = ""
-    has_commits = False
+    parts = []
 
     for section_title, custom_type_sections in custom_sections.items():
-        custom_content = ""
-        custom_has_commits = False
+        sections = []
 
         for type_config in config["types"]:
             commit_type = type_config["type"]
             if commit_type in custom_type_sections:
                 type_data = custom_type_sections[commit_type]
-                section = _generate_section_for_type(type_data, config, "###")
+                section = _generate_section_for_type(type_data, config, repo_url, "###")
                 if section:
-                    custom_has_commits = True
-                    custom_content += section
+                    sections.append(section)
 
-        if custom_has_commits:
-            has_commits = True
-            content += f"## {section_title}\n\n{custom_content}"
+        if sections:
+            parts.append(f"## {section_title}\n\n")
+            parts.extend(sections)
 
-    return content, has_commits
+    return "".join(parts), bool(parts)
 
 
 def generate_content(type_sections: dict, custom_sections: dict, config: dict) -> str:
     """Generate the release notes content from processed commits"""
+    # The repository URL is the same for every commit line
+    repo_url = _get_repo_url()
+
     # Generate main sections
-    main_content, main_has_commits = _generate_main_sections(type_sections, config)
+    main_content, main_has_commits = _generate_main_sections(
+        type_sections, config, repo_url
+    )
 
     # Generate custom sections
     custom_content, custom_has_commits = _generate_custom_sections(
-        custom_sections, config
+        custom_sections, config, repo_url
     )
 
     # Combine content
@@ -1082,18 +1253,20 @@ def write_and_output_results(
         if github_output:
             try:
                 with open(github_output, "a") as f:
-                    f.write(f"release-notes-path={output_file}\n")
-                    f.write(f"total-commits={total_commits}\n")
+                    f.write(
+                        f"release-notes-path={output_file}\n"
+                        f"total-commits={total_commits}\n"
+                    )
                 print(
                     f"✅ GitHub Action outputs set: release-notes-path={output_file}, total-commits={total_commits}"
                 )
             except OSError as e:
                 print(f"Warning: Could not write to GITHUB_OUTPUT: {e}")
 
-        # Print to console as well
-        print("\n" + "=" * 80)
-        print(release_notes)
-        print("=" * 80)
+        # Print to console as well, as one write rather than line by line
+        separator = "=" * 80
+        sys.stdout.write(f"\n{separator}\n{release_notes}\n{separator}\n")
+        sys.stdout.flush()
 
     except OSError as e:
         print(f"Error writing to {output_file}: {e}")
@@ -1136,7 +1309,7 @@ def generate_release_notes(
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Generate release notes between two git tags using PyGithub GraphQL"
+        description="Generate release notes between two git tags using the GitHub GraphQL API"
     )
     parser.add_argument("from_tag", help="Starting tag (e.g., v1.2.15)")
     parser.add_argument("to_tag", help="Ending tag (e.g., v1.2.16)")
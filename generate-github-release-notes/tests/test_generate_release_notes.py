@@ -95,6 +95,22 @@ class TestReleaseNotesGenerator(unittest.TestCase):
             config["issueUrlFormat"], "https://example.com/{{prefix}}{{id}}"
         )
 
+    def test_load_version_config_cached_until_modified(self):
+        """Test that .versionrc.json is parsed once and reloaded after changes"""
+        with open(".versionrc.json", "w") as f:
+            json.dump({"types": [{"type": "feat", "section": "Features"}]}, f)
+
+        config = load_version_config()
+        self.assertIs(load_version_config(), config)
+
+        with open(".versionrc.json", "w") as f:
+            json.dump({"types": [{"type": "fix", "section": "Fixes"}]}, f)
+        stat = os.stat(".versionrc.json")
+        os.utime(".versionrc.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        reloaded = load_version_config()
+        self.assertEqual(reloaded["types"][0]["type"], "fix")
+
     def test_parse_commit_message_conventional(self):
         """Test parsing conventional commit messages"""
         # Test with scope and PR - function returns tuple now
@@ -151,7 +167,7 @@ class TestReleaseNotesGenerator(unittest.TestCase):
         # Test duplicates
         config = {"issuePrefixes": ["DATAGO-"]}
         issues = extract_issue_numbers("DATAGO-123 DATAGO-123 DATAGO-456", config)
-        self.assertEqual(set(issues), {"DATAGO-123", "DATAGO-456"})
+        self.assertEqual(issues, ["DATAGO-123", "DATAGO-456"])
 
         # Test no config
         config = {}
@@ -190,6 +206,24 @@ class TestReleaseNotesGenerator(unittest.TestCase):
         result = clean_subject("DATAGO-123: add new feature", config)
         self.assertEqual(result, "DATAGO-123: add new feature")
 
+    def test_clean_subject_multiple_references(self):
+        """Test cleaning subjects that carry several issue references"""
+        config = {"issuePrefixes": ["DATAGO-", "MRE-"]}
+        cases = [
+            ("add DATAGO-12 and DATAGO-13 - login", "add login"),
+            (
+                "DATAGO-1, DATAGO-12 and DATAGO-9 - add login page",
+                "add login page",
+            ),
+            ("DATAGO-1 and MRE-2: fix crash", "fix crash"),
+            ("fix crash DATAGO-5 and DATAGO-6", "fix crash"),
+            ("DATAGO-7 - MRE-8 - update docs", "update docs"),
+            ("DATAGO-3, MRE-4: tidy up", "tidy up"),
+        ]
+        for subject, expected in cases:
+            with self.subTest(subject=subject):
+                self.assertEqual(clean_subject(subject, config), expected)
+
     @patch.dict(
         os.environ, {"GITHUB_TOKEN": "fake_token", "GITHUB_REPOSITORY": "test/repo"}
     )
@@ -223,7 +257,7 @@ class TestReleaseNotesGenerator(unittest.TestCase):
         self.assertEqual(commits[0]["author"], "Test User")
         mock_graphql.assert_called_once()
 
-    @patch.object(generate_github_release_notes.requests, "get")
+    @patch.object(generate_github_release_notes.requests.Session, "get")
     def test_resolve_version_ref_swaps_removed_v_prefix(self, mock_get):
         """Test resolving refs when repositories drop the leading v prefix."""
         missing_response = MagicMock()
@@ -240,7 +274,7 @@ class TestReleaseNotesGenerator(unittest.TestCase):
         self.assertEqual(mock_get.call_count, 2)
         self.assertTrue(mock_get.call_args_list[1].args[0].endswith("/git/ref/tags/1.2.3"))
 
-    @patch.object(generate_github_release_notes.requests, "get")
+    @patch.object(generate_github_release_notes.requests.Session, "get")
     def test_resolve_version_ref_skips_non_version_refs(self, mock_get):
         """Test that non-version refs are returned unchanged."""
         resolved_ref = generate_github_release_notes._resolve_version_ref(
@@ -271,13 +305,13 @@ class TestReleaseNotesGenerator(unittest.TestCase):
 
         self.assertEqual(commits, [])
         mock_graphql.assert_called_once_with(
-            mock_create_graphql_client.return_value,
+            mock_create_graphql_client.return_value.__enter__.return_value,
             "test/repo",
             "1.0.0",
             "1.1.0",
         )
 
-    @patch.object(generate_github_release_notes.requests, "get")
+    @patch.object(generate_github_release_notes.requests.Session, "get")
     def test_get_commits_with_compare_rest_extracts_commit_data(self, mock_get):
         """Test REST compare fallback response parsing."""
         response = MagicMock()
@@ -343,14 +377,234 @@ class TestReleaseNotesGenerator(unittest.TestCase):
         mock_compare_rest.return_value = fallback_commits
         mock_resolve_ref.side_effect = ["1.0.0", "1.1.0"]
         mock_create_graphql_client.return_value = MagicMock()
+        graphql_session = mock_create_graphql_client.return_value.__enter__.return_value
+        graphql_session.execute.return_value = {
+            "repository": {"c0": {"associatedPullRequests": {"nodes": []}}}
+        }
 
         commits = get_commits_between_refs("v1.0.0", "v1.1.0")
 
         self.assertEqual(commits, fallback_commits)
+        self.assertIsNone(commits[0]["pr_number"])
         mock_compare_rest.assert_called_once_with(
             "fake_token", "test/repo", "1.0.0", "1.1.0"
         )
 
+    @patch.object(generate_github_release_notes.requests.Session, "get")
+    def test_get_commits_with_compare_rest_fetches_all_pages_in_order(self, mock_get):
+        """Test REST compare pages after the first are fetched and kept in order."""
+
+        def compare_page(url, headers, params, timeout):
+            page = params["page"]
+            count = 50 if page == 3 else 100
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "total_commits": 250,
+                "commits": [
+                    {
+                        "sha": f"{page}{index:039d}",
+                        "commit": {
+                            "message": f"fix: change {page}-{index}",
+                            "author": {"name": "Test User"},
+                        },
+                    }
+                    for index in range(count)
+                ],
+            }
+            return response
+
+        mock_get.side_effect = compare_page
+
+        commits = generate_github_release_notes._get_commits_with_compare_rest(
+            "fake_token", "test/repo", "1.0.0", "1.1.0"
+        )
+
+        self.assertEqual(len(commits), 250)
+        self.assertEqual(commits[0]["subject"], "fix: change 1-0")
+        self.assertEqual(commits[100]["subject"], "fix: change 2-0")
+        self.assertEqual(commits[-1]["subject"], "fix: change 3-49")
+        requested_pages = sorted(
+            call.kwargs["params"]["page"] for call in mock_get.call_args_list
+        )
+        self.assertEqual(requested_pages, [1, 2, 3])
+
+    def test_create_version_range_orders_semantically(self):
+        """Test custom section version ranges use semantic, not string, order."""
+        version_range = generate_github_release_notes._create_version_range(
+            ["ui-v0.9.1", "ui-v0.10.0", "ui-v0.9.2"]
+        )
+        self.assertEqual(version_range, "ui-v0.9.1 → ui-v0.10.0")
+
+    def test_graphql_compare_requests_total_on_first_page_only(self):
+        """Test the commit total is only requested with the first page."""
+
+        def page(oid, has_next_page):
+            return {
+                "repository": {
+                    "baseTagRef": {
+                        "compare": {
+                            "commits": {
+                                "pageInfo": {
+                                    "hasNextPage": has_next_page,
+                                    "endCursor": "cursor1",
+                                },
+                                "nodes": [
+                                    {
+                                        "oid": oid,
+                                        "abbreviatedOid": oid[:7],
+                                        "messageHeadline": "fix: resolve issue",
+                                        "author": {"name": "Test User"},
+                                        "associatedPullRequests": {"nodes": []},
+                                    }
+                                ],
+                            }
+                        }
+                    }
+                }
+            }
+
+        graphql_client = MagicMock()
+        graphql_client.execute.side_effect = [
+            page("a" * 40, True),
+            page("b" * 40, False),
+        ]
+
+        commits = generate_github_release_notes._get_commits_with_prs_graphql(
+            graphql_client, "test/repo", "1.0.0", "1.1.0"
+        )
+
+        self.assertEqual(
+            [commit["full_hash"] for commit in commits], ["a" * 40, "b" * 40]
+        )
+        include_total = [
+            call.kwargs["variable_values"]["includeTotal"]
+            for call in graphql_client.execute.call_args_list
+        ]
+        self.assertEqual(include_total, [True, False])
+
+    def test_graphql_compare_stops_without_end_cursor(self):
+        """Test pagination stops when a page claims more results but has no cursor."""
+        graphql_client = MagicMock()
+        graphql_client.execute.return_value = {
+            "repository": {
+                "baseTagRef": {
+                    "compare": {
+                        "commits": {
+                            "pageInfo": {"hasNextPage": True, "endCursor": None},
+                            "nodes": [
+                                {
+                                    "oid": "a" * 40,
+                                    "abbreviatedOid": "a" * 7,
+                                    "messageHeadline": "fix: resolve issue",
+                                    "author": {"name": "Test User"},
+                                    "associatedPullRequests": {"nodes": []},
+                                }
+                            ],
+                        }
+                    }
+                }
+            }
+        }
+
+        commits = generate_github_release_notes._get_commits_with_prs_graphql(
+            graphql_client, "test/repo", "1.0.0", "1.1.0"
+        )
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(graphql_client.execute.call_count, 1)
+
+    def test_extract_commit_from_node_handles_missing_author_name(self):
+        """Test a GraphQL commit whose author has no name is credited to Unknown."""
+        for author in ({"name": None}, None):
+            with self.subTest(author=author):
+                commit = generate_github_release_notes._extract_commit_from_node(
+                    {
+                        "oid": "a" * 40,
+                        "abbreviatedOid": "a" * 7,
+                        "messageHeadline": "fix: resolve issue",
+                        "author": author,
+                        "associatedPullRequests": {"nodes": []},
+                    }
+                )
+                self.assertEqual(commit["author"], "Unknown")
+
+    def test_attach_pr_numbers_batches_lookups(self):
+        """Test PR numbers are resolved with one aliased GraphQL query per batch."""
+        commits = [
+            {
+                "hash": f"{index:07x}",
+                "full_hash": f"{index:040x}",
+                "subject": f"fix: change {index}",
+                "author": "Test User",
+                "pr_number": "7" if index == 0 else None,
+            }
+            for index in range(151)
+        ]
+
+        # Alias cN in every batch resolves to PR 1000 + N
+        batch_response = {
+            "repository": {
+                f"c{index}": {
+                    "associatedPullRequests": {"nodes": [{"number": 1000 + index}]}
+                }
+                for index in range(100)
+            }
+        }
+
+        graphql_client = MagicMock()
+        graphql_client.execute.return_value = batch_response
+
+        generate_github_release_notes._attach_pr_numbers(
+            graphql_client, "test/repo", commits
+        )
+
+        self.assertEqual(graphql_client.execute.call_count, 2)
+        last_variables = graphql_client.execute.call_args.kwargs["variable_values"]
+        self.assertEqual(last_variables["owner"], "test")
+        self.assertEqual(last_variables["repo"], "repo")
+        self.assertEqual(last_variables["s0"], commits[101]["full_hash"])
+        self.assertEqual(len(last_variables), 2 + 50)
+        self.assertEqual(commits[0]["pr_number"], "7")
+        self.assertEqual(commits[1]["pr_number"], "1000")
+        self.assertEqual(commits[100]["pr_number"], "1099")
+        self.assertEqual(commits[101]["pr_number"], "1000")
+
+    def test_attach_pr_numbers_ignores_lookup_failures(self):
+        """Test a failed PR lookup batch keeps numbers resolved by other batches."""
+        commits = [
+            {
+                "hash": f"{index:07x}",
+                "full_hash": f"{index:040x}",
+                "subject": "fix: resolve flaky release notes",
+                "author": "Test User",
+                "pr_number": None,
+            }
+            for index in range(101)
+        ]
+        first_batch_response = {
+            "repository": {
+                f"c{index}": {
+                    "associatedPullRequests": {"nodes": [{"number": 1000 + index}]}
+                }
+                for index in range(100)
+            }
+        }
+        graphql_client = MagicMock()
+        graphql_client.execute.side_effect = [
+            first_batch_response,
+            Exception("Response ended prematurely"),
+        ]
+
+        generate_github_release_notes._attach_pr_numbers(
+            graphql_client, "test/repo", commits
+        )
+
+        self.assertEqual(graphql_client.execute.call_count, 2)
+        self.assertEqual(commits[0]["pr_number"], "1000")
+        self.assertEqual(commits[99]["pr_number"], "1099")
+        self.assertIsNone(commits[100]["pr_number"])
+
     @patch.dict(
         os.environ, {"GITHUB_TOKEN": "fake_token", "GITHUB_REPOSITORY": "test/repo"}
     )